@@ -0,0 +1,110 @@
+# Line-level diff helpers shared by the API and the diff worker processes
+# 纯函数、无副作用（不连接数据库、不创建应用），进程池子进程只需导入本模块
+import difflib
+from typing import List, Optional
+
+# 行级差异匹配优先使用cdifflib（SequenceMatcher的C实现，结果与difflib一致）；未安装时使用标准库difflib
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    SequenceMatcher = difflib.SequenceMatcher
+
+def _format_unified_range(start: int, stop: int) -> str:
+    """将行区间转换为unified diff头部格式（与difflib一致）"""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+def _line_opcodes(from_lines: List[str], to_lines: List[str]) -> List[tuple]:
+    """计算行级匹配操作码，先剥离相同的首尾行，只对中间变化区域运行 SequenceMatcher（已安装cdifflib时为C实现）"""
+    max_prefix = min(len(from_lines), len(to_lines))
+    prefix = 0
+    while prefix < max_prefix and from_lines[prefix] == to_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < max_prefix - prefix and from_lines[-1 - suffix] == to_lines[-1 - suffix]:
+        suffix += 1
+    from_end = len(from_lines) - suffix
+    to_end = len(to_lines) - suffix
+    
+    codes = []
+    if prefix:
+        codes.append(('equal', 0, prefix, 0, prefix))
+    if prefix < from_end and prefix < to_end:
+        matcher = SequenceMatcher(None, from_lines[prefix:from_end], to_lines[prefix:to_end])
+        codes.extend(
+            (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        )
+    elif prefix < from_end:
+        # 中间区域只有删除行（含整个文件被删除），无需匹配
+        codes.append(('delete', prefix, from_end, prefix, prefix))
+    elif prefix < to_end:
+        # 中间区域只有新增行（含新增文件），无需匹配
+        codes.append(('insert', prefix, prefix, prefix, to_end))
+    if suffix:
+        codes.append(('equal', from_end, len(from_lines), to_end, len(to_lines)))
+    return codes
+
+def _group_opcodes(codes: List[tuple], n: int = 3):
+    """按上下文行数将操作码分组（与 SequenceMatcher.get_grouped_opcodes 一致）"""
+    codes = list(codes) or [('equal', 0, 1, 0, 1)]
+    # 首尾无变化的区域只保留 n 行上下文
+    if codes[0][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+    
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        # 较长的无变化区域结束当前分组
+        if tag == 'equal' and i2 - i1 > n + n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        yield group
+
+def diff_source_lines(from_lines: List[str], to_lines: List[str]) -> tuple:
+    """对两个版本的行只做一次匹配，同时得到新增/删除行数和unified diff行（不含文件头）
+
+    返回 (additions, deletions, diff_lines)，diff_lines 与 difflib.unified_diff(lineterm='') 的 @@ 块格式一致
+    """
+    codes = _line_opcodes(from_lines, to_lines)
+    
+    additions = 0
+    deletions = 0
+    for tag, i1, i2, j1, j2 in codes:
+        if tag != 'equal':
+            deletions += i2 - i1
+            additions += j2 - j1
+    
+    diff_lines = []
+    for group in _group_opcodes(codes):
+        first, last = group[0], group[-1]
+        diff_lines.append(f"@@ -{_format_unified_range(first[1], last[2])} +{_format_unified_range(first[3], last[4])} @@")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                diff_lines.extend(' ' + line for line in from_lines[i1:i2])
+                continue
+            if tag in ('replace', 'delete'):
+                diff_lines.extend('-' + line for line in from_lines[i1:i2])
+            if tag in ('replace', 'insert'):
+                diff_lines.extend('+' + line for line in to_lines[j1:j2])
+    
+    return additions, deletions, diff_lines
+
+def diff_source_texts(from_text: Optional[str], to_text: Optional[str]) -> tuple:
+    """按行切分两个版本的源码内容后计算行级差异（纯函数，可在子进程中执行）"""
+    return diff_source_lines(
+        from_text.split('\n') if from_text else [''],
+        to_text.split('\n') if to_text else ['']
+    )
@@ -7,89 +7,155 @@ Analyze JAR package version information for each service in test environment and
 
 import os
 import re
+import csv
+import socket
+import threading
 import pandas as pd
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import paramiko
 from scp import SCPClient
 
 
+# SSH connection tuning: large socket buffers and flow-control window, rare rekeying
+SOCKET_BUFFER_SIZE = 32 * 1024 * 1024
+SSH_WINDOW_SIZE = 2147483647
+SSH_REKEY_BYTES = pow(2, 40)
+
+# Report column name cleaning
+COLUMN_NAME_TRANSLATION = str.maketrans({'.': '_POINT_', '-': '_'})
+INVALID_COLUMN_CHARS = re.compile(r'[^\w]')
+
+# Byte order marks checked before falling back to trial decoding (UTF-32 first, its LE BOM starts with UTF-16's)
+BOM_ENCODINGS = [
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe\x00\x00', 'utf-32'),
+    (b'\x00\x00\xfe\xff', 'utf-32'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+]
+FALLBACK_ENCODINGS = ['utf-8', 'gbk', 'gb2312', 'latin-1']
+
+# Server list file columns, in file order
+SERVER_LIST_COLUMNS = ['ip', 'port', 'username', 'password', 'service_name', 'jar_dir']
+
+
+def _detect_encoding(data):
+    """Detect the text encoding of raw file bytes, returns None if nothing decodes"""
+    for bom, encoding in BOM_ENCODINGS:
+        if data.startswith(bom):
+            return encoding
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            data.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def _read_text(file_path):
+    """Read a text file once and decode it with the detected encoding, returns (text, encoding)"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    encoding = _detect_encoding(data)
+    if encoding is None:
+        return None, None
+    return data.decode(encoding), encoding
+
+
+class JarRow:
+    """One JAR/class file entry of a service (slotted to keep per-row memory small)"""
+    __slots__ = ('filename', 'display_name', 'size', 'modify_date', 'date_str')
+    
+    def __init__(self, filename, display_name, size, modify_date, date_str):
+        self.filename = filename
+        self.display_name = display_name
+        self.size = size
+        self.modify_date = modify_date
+        self.date_str = date_str
+
+
 class JarInfoParser:
     """JAR/Class file information parser"""
     
     def __init__(self, classes_dir="classes"):
-        self.jar_pattern = re.compile(r'-rw[a-z-]*\s+\d+\s+\w+\s+\w+\s+(\d+)\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}(?::\d{2})?)\s+(.+\.(?:jar|class))$')
+        # Groups: size, date string, year, month, day, hour, minute, optional second, filename
+        self.jar_pattern = re.compile(r'-rw[a-z-]*\s+\d+\s+\w+\s+\w+\s+(\d+)\s+((\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})(?::(\d{2}))?)\s+(.+\.(?:jar|class))$', re.ASCII)
         self.classes_dir = classes_dir
     
     def parse_file(self, file_path):
         """Parse content of a single file"""
         jar_files = []
         
-        # Try different encoding formats
-        encodings = ['utf-8-sig', 'utf-8', 'gbk', 'gb2312', 'latin-1']
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    for line in f:
-                        line = line.strip()
-                        match = self.jar_pattern.match(line)
-                        if match:
-                            size = int(match.group(1))
-                            date_str = match.group(2)
-                            filename = match.group(3)
-                            
-                            # Parse date time (try both formats: with and without seconds)
-                            modify_date = None
-                            try:
-                                # Try format with seconds first
-                                modify_date = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                            except ValueError:
-                                try:
-                                    # Try format without seconds
-                                    modify_date = datetime.strptime(date_str, '%Y-%m-%d %H:%M')
-                                except ValueError:
-                                    modify_date = None
-                            
-                            # Extract class name for .class files
-                            display_name = filename
-                            if filename.endswith('.class'):
-                                class_name = self.extract_class_name(filename)
-                                if class_name:
-                                    display_name = class_name
-                            
-                            jar_files.append({
-                                'filename': filename,
-                                'display_name': display_name,
-                                'size': size,
-                                'modify_date': modify_date,
-                                'date_str': date_str
-                            })
-                break  # Successfully parsed, break loop
-            except UnicodeDecodeError:
-                continue
-        else:
+        # Read the file once with its detected encoding
+        text, encoding = _read_text(file_path)
+        if text is None:
             print(f"Error: Unable to read file {file_path} with any encoding format")
-            
+            return jar_files
+        
+        for line in text.splitlines():
+            line = line.strip()
+            # Only regular file lines can match, skip totals/blank lines without invoking the regex
+            if not line.startswith('-rw'):
+                continue
+            match = self.jar_pattern.match(line)
+            if match:
+                jar_files.append(self._row_from_match(match))
+        
         return jar_files
     
+    def _row_from_match(self, match):
+        """Build a JAR/class information row from a jar_pattern match"""
+        size, date_str, year, month, day, hour, minute, second, filename = match.groups()
+        
+        # Build date time directly from the captured fields (seconds are optional)
+        try:
+            modify_date = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second or 0))
+        except ValueError:
+            modify_date = None
+        
+        # Extract class name for .class files
+        display_name = filename
+        if filename.endswith('.class'):
+            class_name = self._extract_cached(filename, self.classes_dir)
+            if class_name:
+                display_name = class_name
+        
+        return JarRow(
+            filename=filename,
+            display_name=display_name,
+            size=int(size),
+            modify_date=modify_date,
+            date_str=date_str
+        )
+    
     def extract_class_name(self, filepath):
         """Extract class full name from .class file path"""
+        return self._extract_cached(filepath, self.classes_dir)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_cached(filepath, classes_dir):
+        """Extract class full name from .class file path (cached, the same paths recur across services)"""
         # Find classes directory in the path
-        classes_index = filepath.find(f'/{self.classes_dir}/')
+        classes_index = filepath.find(f'/{classes_dir}/')
         if classes_index == -1:
             # Try without leading slash
-            classes_index = filepath.find(self.classes_dir + '/')
+            classes_index = filepath.find(classes_dir + '/')
             if classes_index == -1:
                 return None
         
         # Extract path after classes directory
-        if filepath.find(f'/{self.classes_dir}/') >= 0:
+        if filepath.find(f'/{classes_dir}/') >= 0:
             # Skip the classes directory part (with leading slash)
-            class_path = filepath[classes_index + len(f'/{self.classes_dir}/'):]
+            class_path = filepath[classes_index + len(f'/{classes_dir}/'):]
         else:
             # Skip the classes directory part (without leading slash)
-            class_path = filepath[classes_index + len(self.classes_dir + '/'):]
+            class_path = filepath[classes_index + len(classes_dir + '/'):]
         
         # Remove .class extension
         if class_path.endswith('.class'):
@@ -106,38 +172,47 @@ class JarInfoParser:
         
         for line in output.strip().split('\n'):
             line = line.strip()
+            # Only regular file lines can match, skip totals/blank lines without invoking the regex
+            if not line.startswith('-rw'):
+                continue
             match = self.jar_pattern.match(line)
             if match:
-                size = int(match.group(1))
-                date_str = match.group(2)
-                filename = match.group(3)
-                
-                # Parse date time (try both formats: with and without seconds)
-                modify_date = None
-                try:
-                    # Try format with seconds first
-                    modify_date = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                except ValueError:
-                    try:
-                        # Try format without seconds
-                        modify_date = datetime.strptime(date_str, '%Y-%m-%d %H:%M')
-                    except ValueError:
-                        modify_date = None
-                
-                # Extract class name for .class files
-                display_name = filename
-                if filename.endswith('.class'):
-                    class_name = self.extract_class_name(filename)
-                    if class_name:
-                        display_name = class_name
-                
-                jar_files.append({
-                    'filename': filename,
-                    'display_name': display_name,
-                    'size': size,
-                    'modify_date': modify_date,
-                    'date_str': date_str
-                })
+                jar_files.append(self._row_from_match(match))
+        
+        return jar_files
+    
+    def parse_tsv_output(self, output):
+        """Parse tab-separated `find -printf '%s\\t%TY-%Tm-%Td %TH:%TM:%TS\\t%f\\n'` output"""
+        jar_files = []
+        
+        for line in output.splitlines():
+            parts = line.split('\t', 2)
+            if len(parts) != 3:
+                continue
+            size_str, date_str, filename = parts
+            
+            # Drop fractional seconds so the date matches the ls time style
+            date_str = date_str[:19]
+            try:
+                modify_date = datetime(*map(int, date_str.replace('-', ' ').replace(':', ' ').split()))
+                size = int(size_str)
+            except ValueError:
+                continue
+            
+            # Extract class name for .class files
+            display_name = filename
+            if filename.endswith('.class'):
+                class_name = self._extract_cached(filename, self.classes_dir)
+                if class_name:
+                    display_name = class_name
+            
+            jar_files.append(JarRow(
+                filename=filename,
+                display_name=display_name,
+                size=size,
+                modify_date=modify_date,
+                date_str=date_str
+            ))
         
         return jar_files
 
@@ -145,19 +220,30 @@ class JarInfoParser:
 class JarAnalyzer:
     """JAR file analyzer"""
     
-    def __init__(self, data_dir=None, server_list_file=None, internal_prefix_file=None, classes_dir="classes"):
+    def __init__(self, data_dir=None, server_list_file=None, internal_prefix_file=None, classes_dir="classes", max_workers=16):
         self.data_dir = data_dir
         self.server_list_file = server_list_file
         self.internal_prefix_file = internal_prefix_file
         self.classes_dir = classes_dir
+        self.max_workers = max_workers  # Maximum concurrent server connections
         self.parser = JarInfoParser(classes_dir=classes_dir)
         self.services_data = {}
         self.all_jars = set()
         self.class_display_names = set()  # display_name set which originated from .class files
-        self.server_df = None
+        self.server_list = []
+        self._svc_index = {}  # service -> {display_name: jar_info}
+        self._latest = {}  # display_name -> (latest modify_date, size)
+        self._transports = {}  # (ip, port, username, password) -> paramiko.Transport, reused per host
+        self._transport_locks = {}
+        self._transport_lock = threading.Lock()
         
         # Load internal dependency prefixes
         self.internal_prefixes = self._load_internal_prefixes()
+        # Single case-insensitive alternation of all prefixes, never matches when there are none
+        self._prefix_re = re.compile(
+            '^(?:' + '|'.join(re.escape(prefix) for prefix in self.internal_prefixes) + ')' if self.internal_prefixes else '(?!)',
+            re.IGNORECASE
+        )
         
     def extract_service_name(self, filename):
         """Extract service name from filename (service_name_IP_address format)"""
@@ -189,16 +275,12 @@ class JarAnalyzer:
         """Load internal dependency prefix list"""
         if self.internal_prefix_file and os.path.exists(self.internal_prefix_file):
             print(f"Loading internal dependency prefix file: {self.internal_prefix_file}")
-            # Try different encoding formats
-            encodings = ['utf-8-sig', 'utf-8', 'gbk', 'gb2312', 'latin-1']
-            for encoding in encodings:
-                try:
-                    with open(self.internal_prefix_file, 'r', encoding=encoding) as f:
-                        prefixes = [line.strip() for line in f if line.strip()]
-                    print(f"Successfully loaded {len(prefixes)} internal dependency prefixes using encoding {encoding}")
-                    return prefixes
-                except UnicodeDecodeError:
-                    continue
+            # Read the file once with its detected encoding
+            text, encoding = _read_text(self.internal_prefix_file)
+            if text is not None:
+                prefixes = [line.strip() for line in text.splitlines() if line.strip()]
+                print(f"Successfully loaded {len(prefixes)} internal dependency prefixes using encoding {encoding}")
+                return prefixes
             else:
                 print(f"Warning: Unable to read internal dependency prefix file with any encoding format")
         
@@ -230,63 +312,131 @@ class JarAnalyzer:
             
         print("Loading server connection information...")
         try:
-            # Try different encoding formats
-            encodings = ['utf-8-sig', 'utf-8', 'gbk', 'gb2312', 'latin-1']
-            for encoding in encodings:
-                try:
-                    self.server_df = pd.read_csv(self.server_list_file, encoding=encoding)
-                    print(f"Successfully loaded server information using encoding {encoding}")
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
+            # Read the file once with its detected encoding
+            text, encoding = _read_text(self.server_list_file)
+            if text is None:
                 raise Exception("Unable to read file with any encoding format")
+            print(f"Successfully loaded server information using encoding {encoding}")
             
-            # Set column names
-            self.server_df.columns = ['ip', 'port', 'username', 'password', 'service_name', 'jar_dir']
-            print(f"Successfully loaded server information, total {len(self.server_df)} servers")
+            # The list is small, plain csv rows are enough; the first row is the header, blank rows are skipped
+            rows = [row for row in csv.reader(text.splitlines()) if any(cell.strip() for cell in row)][1:]
+            # Set column names, missing trailing cells are empty
+            self.server_list = [dict(zip(SERVER_LIST_COLUMNS, row + [''] * (len(SERVER_LIST_COLUMNS) - len(row)))) for row in rows]
+            print(f"Successfully loaded server information, total {len(self.server_list)} servers")
             return True
         except Exception as e:
             print(f"Error: Failed to load server information: {e}")
             return False
     
+    def _get_transport(self, server_info):
+        """Get an authenticated SSH transport for the server, reusing an open one for the same host"""
+        ip_address = server_info['ip']
+        port = int(server_info['port'])
+        key = (ip_address, port, server_info['username'], server_info['password'])
+        
+        # One lock per host so different hosts still connect concurrently
+        with self._transport_lock:
+            host_lock = self._transport_locks.setdefault(key, threading.Lock())
+        
+        with host_lock:
+            transport = self._transports.get(key)
+            if transport is not None and transport.is_active():
+                return transport
+            
+            # Build the socket manually to disable Nagle and enlarge kernel buffers
+            sock = socket.create_connection((ip_address, port), timeout=30)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            
+            transport = paramiko.Transport(sock, default_window_size=SSH_WINDOW_SIZE)
+            transport.packetizer.REKEY_BYTES = SSH_REKEY_BYTES
+            transport.packetizer.REKEY_PACKETS = SSH_REKEY_BYTES
+            try:
+                transport.connect(username=server_info['username'], password=server_info['password'])
+            except Exception:
+                transport.close()
+                raise
+            
+            self._transports[key] = transport
+            return transport
+    
+    def close_connections(self, ip_address=None):
+        """Close cached SSH transports, only those of one host when ip_address is given"""
+        with self._transport_lock:
+            for key in list(self._transports):
+                if ip_address is None or key[0] == ip_address:
+                    self._transports.pop(key).close()
+    
     def get_jar_info_from_server(self, server_info):
         """Get JAR file information from server"""
         try:
-            # Create SSH connection
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            # Connect to server
-            ssh.connect(
-                hostname=server_info['ip'],
-                port=int(server_info['port']),
-                username=server_info['username'],
-                password=server_info['password'],
-                timeout=30
-            )
+            # Get (or reuse) the SSH connection for this host
+            transport = self._get_transport(server_info)
             
-            # Execute ls command to get JAR file information
+            # List JAR files as tab-separated size, modify time and name (no ls formatting to parse)
             jar_dir = server_info['jar_dir'].replace('\\', '/')
-            command = f"ls -lah --block-size=1 --time-style='+%Y-%m-%d %H:%M:%S' {jar_dir} | grep '\\.jar$'"
-            
-            stdin, stdout, stderr = ssh.exec_command(command)
-            output = stdout.read().decode('utf-8')
-            error = stderr.read().decode('utf-8')
+            command = f"find {jar_dir} -maxdepth 1 -type f -name '*.jar' -printf '%s\\t%TY-%Tm-%Td %TH:%TM:%TS\\t%f\\n'"
+            output, error = self._exec_command(transport, command)
             
-            ssh.close()
+            if error and not output:
+                # find without -printf support (e.g. busybox), fall back to ls
+                command = f"ls -lah --block-size=1 --time-style='+%Y-%m-%d %H:%M:%S' {jar_dir} | grep '\\.jar$'"
+                output, error = self._exec_command(transport, command)
+                jar_files = self.parser.parse_ssh_output(output)
+            else:
+                jar_files = self.parser.parse_tsv_output(output)
             
             if error:
                 print(f"  Warning: {error.strip()}")
             
-            # Parse output
-            jar_files = self.parser.parse_ssh_output(output)
             return jar_files
             
         except Exception as e:
             print(f"  Connection failed: {e}")
             return []
     
+    def _exec_command(self, transport, command):
+        """Run a command on an SSH transport, returns (stdout, stderr)"""
+        channel = transport.open_session(timeout=30)
+        try:
+            channel.exec_command(command)
+            output = channel.makefile('rb').read().decode('utf-8')
+            error = channel.makefile_stderr('rb').read().decode('utf-8')
+        finally:
+            channel.close()
+        return output, error
+    
+    def _fetch_one(self, server_info):
+        """Get JAR file information for one server list row, returns (service_name, jar_files)"""
+        # Handle empty IP address
+        ip_address = server_info['ip'] or 'unknown'
+        service_name = f"{server_info['service_name']}_{ip_address.replace('.', '_')}"
+        
+        print(f"Getting service: {service_name} @ {ip_address}")
+        
+        # Check if server info has username and password
+        if not server_info['username'] or not server_info['password']:
+            print(f"  No username/password provided, treating as local directory: {server_info['jar_dir']}")
+            jar_files = self.get_jar_info_from_local_dir(server_info['jar_dir'], service_name)
+        else:
+            jar_files = self.get_jar_info_from_server(server_info)
+        
+        return service_name, jar_files
+    
+    def _fetch_host(self, rows):
+        """Get JAR file information for all server list rows of one host over one connection,
+        returns [(row index, service_name, jar_files)]"""
+        results = []
+        try:
+            for idx, server_info in rows:
+                service_name, jar_files = self._fetch_one(server_info)
+                results.append((idx, service_name, jar_files))
+        finally:
+            # This host is done, release its connection instead of holding it until all hosts finish
+            self.close_connections(rows[0][1]['ip'])
+        return results
+    
     def load_all_data(self):
         """Load data for all services"""
         if self.server_list_file:
@@ -302,34 +452,39 @@ class JarAnalyzer:
         if not self.load_server_data():
             return False
         
-        total_servers = len(self.server_df)
+        total_servers = len(self.server_list)
         print(f"Found {total_servers} servers, starting to get JAR information...")
         
-        for idx, (_, server_info) in enumerate(self.server_df.iterrows(), 1):
-            # Handle NaN values in IP address
-            ip_address = str(server_info['ip']) if pd.notna(server_info['ip']) else 'unknown'
-            service_name = f"{server_info['service_name']}_{ip_address.replace('.', '_')}"
-            
-            print(f"[{idx}/{total_servers}] Getting service: {service_name} @ {ip_address}")
-            
-            # Check if server info has username and password
-            if pd.isna(server_info['username']) or pd.isna(server_info['password']) or server_info['username'] == '' or server_info['password'] == '':
-                print(f"  No username/password provided, treating as local directory: {server_info['jar_dir']}")
-                jar_files = self.get_jar_info_from_local_dir(server_info['jar_dir'], service_name)
-            else:
-                jar_files = self.get_jar_info_from_server(server_info)
-            
+        # Group rows by host: each host's directories are listed one after another over a single
+        # connection, while different hosts are independent and network-bound, so fetch them concurrently
+        hosts = defaultdict(list)
+        for idx, server_info in enumerate(self.server_list):
+            hosts[server_info['ip']].append((idx, server_info))
+        
+        results = [None] * total_servers
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self._fetch_host, rows) for rows in hosts.values()]
+                done = 0
+                for future in as_completed(futures):
+                    for idx, service_name, jar_files in future.result():
+                        results[idx] = (service_name, jar_files)
+                        done += 1
+                        
+                        # Show progress percentage
+                        progress = (done / total_servers) * 100
+                        print(f"[{done}/{total_servers}] Finished service: {service_name}")
+                        print(f"    Progress: {progress:.1f}% - Found {len(jar_files)} JAR/class files")
+        finally:
+            self.close_connections()
+        
+        # Merge in server list order so the report does not depend on completion order
+        for service_name, jar_files in results:
             self.services_data[service_name] = jar_files
             
             # Collect all JAR/class files
-            for jar_info in jar_files:
-                self.all_jars.add(jar_info['display_name'])
-                if jar_info.get('filename', '').endswith('.class'):
-                    self.class_display_names.add(jar_info['display_name'])
-            
-            # Show progress percentage
-            progress = (idx / total_servers) * 100
-            print(f"    Progress: {progress:.1f}% - Found {len(jar_files)} JAR/class files")
+            self.all_jars.update(jar_info.display_name for jar_info in jar_files)
+            self.class_display_names.update(jar_info.display_name for jar_info in jar_files if jar_info.filename.endswith('.class'))
         
         print(f"\nData loading completed! Found {len(self.all_jars)} JAR/class files in total, distributed across {len(self.services_data)} services")
         return True
@@ -358,10 +513,8 @@ class JarAnalyzer:
             self.services_data[service_name] = jar_files
             
             # Collect all JAR/class files
-            for jar_info in jar_files:
-                self.all_jars.add(jar_info['display_name'])
-                if jar_info.get('filename', '').endswith('.class'):
-                    self.class_display_names.add(jar_info['display_name'])
+            self.all_jars.update(jar_info.display_name for jar_info in jar_files)
+            self.class_display_names.update(jar_info.display_name for jar_info in jar_files if jar_info.filename.endswith('.class'))
             
             # Show progress percentage
             progress = (idx / total_files) * 100
@@ -378,20 +531,40 @@ class JarAnalyzer:
         # Traverse all services to find the latest modification date
         for service_jars in self.services_data.values():
             for jar_info in service_jars:
-                if jar_info['display_name'] == jar_name:
-                    if jar_info['modify_date'] and (latest_date is None or jar_info['modify_date'] > latest_date):
-                        latest_date = jar_info['modify_date']
-                        latest_size = jar_info['size']
+                if jar_info.display_name == jar_name:
+                    if jar_info.modify_date and (latest_date is None or jar_info.modify_date > latest_date):
+                        latest_date = jar_info.modify_date
+                        latest_size = jar_info.size
         
         return latest_date, latest_size
-    
+
+    def _build_indexes(self):
+        """Index JAR/class information by service and display name in a single pass"""
+        self._svc_index = {}
+        self._latest = {}
+
+        for service, service_jars in self.services_data.items():
+            service_index = {}
+            for jar_info in service_jars:
+                display_name = jar_info.display_name
+                # Keep the first occurrence within a service
+                service_index.setdefault(display_name, jar_info)
+
+                # Track the latest modification date across all services
+                modify_date = jar_info.modify_date
+                if modify_date:
+                    latest = self._latest.get(display_name)
+                    if latest is None or modify_date > latest[0]:
+                        self._latest[display_name] = (modify_date, jar_info.size)
+            self._svc_index[service] = service_index
+
     def is_latest_version(self, jar_info, latest_date, latest_size):
         """Check if JAR file is the latest version"""
         if not latest_size:
             return False
             
         # Only compare file size, same size means latest version
-        return jar_info['size'] == latest_size
+        return jar_info.size == latest_size
     
     def is_third_party_dependency(self, jar_filename):
         """Check if JAR file is a third-party dependency"""
@@ -400,22 +573,20 @@ class JarAnalyzer:
             return False
         
         # Check if JAR filename starts with any internal prefix
-        for prefix in self.internal_prefixes:
-            if jar_filename.lower().startswith(prefix.lower()):
-                return False
-        
-        return True
+        return not self._prefix_re.match(jar_filename)
+    
+    def third_party_flags(self, jar_names):
+        """Return 'Yes'/'No' third-party flags for a list of JAR/class names in one pass"""
+        # Class entries are always considered internal dependencies, other names use the compiled prefix check
+        class_display_names = self.class_display_names
+        is_third_party = self.is_third_party_dependency
+        return ['Yes' if name not in class_display_names and is_third_party(name) else 'No' for name in jar_names]
     
     def _clean_column_name(self, name):
         """Clean column name, remove or replace invalid characters"""
-        # Replace characters that may cause problems
-        import re
-        # First replace dots with _POINT_
-        clean_name = re.sub(r'[.]', '_POINT_', name)
-        # Replace hyphens with underscores
-        clean_name = re.sub(r'[-]', '_', clean_name)
-        # Replace other non-alphanumeric characters with underscores, but keep underscores themselves
-        clean_name = re.sub(r'[^\w_]', '_', clean_name)
+        # Replace dots with _POINT_ and hyphens with underscores in one C-level pass,
+        # then replace other non-alphanumeric characters with underscores
+        clean_name = INVALID_COLUMN_CHARS.sub('_', name.translate(COLUMN_NAME_TRANSLATION))
         # Ensure it doesn't start or end with underscores
         clean_name = clean_name.strip('_')
         if not clean_name:
@@ -436,12 +607,14 @@ class JarAnalyzer:
                 return []
             
             jar_files = []
-            for filename in os.listdir(jar_dir):
-                if filename.endswith('.jar'):
-                    jar_path = os.path.join(jar_dir, filename)
+            with os.scandir(jar_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not filename.endswith('.jar') or not entry.is_file():
+                        continue
                     try:
-                        # Get file stats
-                        stat = os.stat(jar_path)
+                        # Get file stats (reuses directory listing data where the OS provides it)
+                        stat = entry.stat()
                         size = stat.st_size
                         modify_time = stat.st_mtime
                         modify_date = datetime.fromtimestamp(modify_time)
@@ -449,17 +622,17 @@ class JarAnalyzer:
                         # Extract class name for .class files
                         display_name = filename
                         if filename.endswith('.class'):
-                            class_name = self.parser.extract_class_name(filename)
+                            class_name = self.parser._extract_cached(filename, self.classes_dir)
                             if class_name:
                                 display_name = class_name
                         
-                        jar_files.append({
-                            'filename': filename,
-                            'display_name': display_name,
-                            'size': size,
-                            'modify_date': modify_date,
-                            'date_str': modify_date.strftime('%Y-%m-%d %H:%M:%S')
-                        })
+                        jar_files.append(JarRow(
+                            filename=filename,
+                            display_name=display_name,
+                            size=size,
+                            modify_date=modify_date,
+                            date_str=modify_date.strftime('%Y-%m-%d %H:%M:%S')
+                        ))
                     except OSError as e:
                         print(f"  Error reading file {filename}: {e}")
                         continue
@@ -472,68 +645,59 @@ class JarAnalyzer:
             return []
     
     def generate_report(self):
-        """Generate analysis report"""
+        """Generate analysis report as a DataFrame, built from the same rows as the CSV report"""
         if not self.services_data:
             print("Error: No data loaded")
             return None
-            
+        
+        rows = self.iter_report_rows()
+        header = next(rows)
+        return pd.DataFrame(list(rows), columns=header)
+    
+    def iter_report_rows(self):
+        """Yield the report header, then one row per JAR/class, without building a DataFrame"""
         # Prepare service list (sorted alphabetically)
         services = sorted(self.services_data.keys())
         
-        # Prepare data rows
-        report_data = []
-        total_jars = len(self.all_jars)
+        # Index data once so each cell is a dict lookup instead of a scan
+        self._build_indexes()
         
+        # Clean service names to ensure valid column names
+        clean_service_names = [self._clean_column_name(service) for service in services]
+        header = ['JAR_Filename', 'Third_Party_Dependency']
+        for clean_service_name in clean_service_names:
+            header += [f'{clean_service_name}_Size', f'{clean_service_name}_Last_Update_Date', f'{clean_service_name}_Is_Latest']
+        yield header
+        
+        total_jars = len(self.all_jars)
         print(f"Starting to generate report, need to process {total_jars} JAR/class files...")
         
-        def _is_class_display_name(name: str) -> bool:
-            """Check if a display name originated from a .class file (based on collected set)."""
-            return name in self.class_display_names
-
-        for idx, jar_name in enumerate(sorted(self.all_jars), 1):
+        jar_names = sorted(self.all_jars)
+        third_party_flags = self.third_party_flags(jar_names)
+        service_indexes = [self._svc_index[service] for service in services]
+        for idx, jar_name in enumerate(jar_names, 1):
             # Find latest version information for this JAR
-            latest_date, latest_size = self.find_latest_version(jar_name)
+            latest_date, latest_size = self._latest.get(jar_name, (None, None))
+            # Without a known latest size every service is 'Unknown'; otherwise only compare file size
+            has_latest = bool(latest_date and latest_size)
             
-            # For class entries, always mark as internal dependency (No)
-            third_party = 'No' if _is_class_display_name(jar_name) else ('Yes' if self.is_third_party_dependency(jar_name) else 'No')
-
-            row_data = {
-                'JAR_Filename': jar_name,
-                'Third_Party_Dependency': third_party
-            }
+            row = [jar_name, third_party_flags[idx - 1]]
             
             # Add three columns for each service: size, last update date, is latest
-            for service in services:
-                service_jars = self.services_data[service]
-                
-                # Find this JAR in the service
-                jar_found = None
-                for jar_info in service_jars:
-                    if jar_info['display_name'] == jar_name:
-                        jar_found = jar_info
-                        break
-                
-                # Clean service name to ensure valid column names
-                clean_service_name = self._clean_column_name(service)
-                
-                if jar_found:
-                    # This service has this JAR
-                    row_data[f'{clean_service_name}_Size'] = jar_found['size']
-                    row_data[f'{clean_service_name}_Last_Update_Date'] = jar_found['date_str']
-                    
-                    # Check if it's the latest version
-                    if latest_date and latest_size:
-                        is_latest = self.is_latest_version(jar_found, latest_date, latest_size)
-                        row_data[f'{clean_service_name}_Is_Latest'] = 'Yes' if is_latest else 'No'
+            for service_index in service_indexes:
+                jar_found = service_index.get(jar_name)
+                if jar_found is not None:
+                    # Check if it's the latest version (same size means latest version)
+                    if has_latest:
+                        is_latest = 'Yes' if jar_found.size == latest_size else 'No'
                     else:
-                        row_data[f'{clean_service_name}_Is_Latest'] = 'Unknown'
+                        is_latest = 'Unknown'
+                    row += [jar_found.size, jar_found.date_str, is_latest]
                 else:
                     # This service doesn't have this JAR
-                    row_data[f'{clean_service_name}_Size'] = ''
-                    row_data[f'{clean_service_name}_Last_Update_Date'] = ''
-                    row_data[f'{clean_service_name}_Is_Latest'] = ''
+                    row += ['', '', '']
             
-            report_data.append(row_data)
+            yield row
             
             # Show progress every 100 JAR/class files
             if idx % 100 == 0 or idx == total_jars:
@@ -541,7 +705,6 @@ class JarAnalyzer:
                 print(f"    Report generation progress: {progress:.1f}% ({idx}/{total_jars})")
         
         print("Report data generation completed!")
-        return pd.DataFrame(report_data)
 
 
 class CSVGenerator:
@@ -554,18 +717,25 @@ class CSVGenerator:
         """Create CSV report"""
         print("Generating CSV report...")
         
-        # Generate report data
-        report_df = self.analyzer.generate_report()
-        if report_df is None:
+        if not self.analyzer.services_data:
+            print("Error: No data loaded")
             return False
         
         print("Writing CSV file...")
-        # Use pandas to write CSV
-        report_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        # Stream rows straight to the file so only one row is held in memory at a time
+        row_count = 0
+        with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            rows = self.analyzer.iter_report_rows()
+            header = next(rows)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow(row)
+                row_count += 1
         
         print(f"CSV report generated: {output_file}")
-        print(f"Total analyzed {len(report_df)} JAR/class files")
-        print(f"Report contains {len(report_df.columns)} columns")
+        print(f"Total analyzed {row_count} JAR/class files")
+        print(f"Report contains {len(header)} columns")
         return True
 
 
@@ -582,6 +752,8 @@ def main():
                         help='Output CSV filename (default: work/output/jar_analysis_report.csv)')
     parser.add_argument('--classes-dir', default='classes',
                         help='Classes directory name for .class file analysis (default: classes)')
+    parser.add_argument('--max-workers', type=int, default=16,
+                        help='Maximum concurrent server connections in --server-list-file mode (default: 16)')
     
     args = parser.parse_args()
     
@@ -603,7 +775,7 @@ def main():
     print()
     
     # Create analyzer
-    analyzer = JarAnalyzer(data_dir=args.data_dir, server_list_file=args.server_list_file, internal_prefix_file=args.internal_prefix_file, classes_dir=args.classes_dir)
+    analyzer = JarAnalyzer(data_dir=args.data_dir, server_list_file=args.server_list_file, internal_prefix_file=args.internal_prefix_file, classes_dir=args.classes_dir, max_workers=args.max_workers)
     
     # Load data
     if not analyzer.load_all_data():
@@ -15,7 +15,10 @@ from sqlalchemy.orm import sessionmaker
 
 # Add the parent directory to the path to import main
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from main import Service, JarFile, ClassFile, JavaSourceFileVersion
+from main import (Service, JarFile, ClassFile, JavaSourceFileVersion, VersionDiffStat,
+                  load_jar_source_rows, load_source_contents, load_version_diff_stats,
+                  class_name_from_source_path, same_source_content)
+from diff_utils import diff_source_texts
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -391,6 +394,85 @@ class VersionManager:
         logger.info(f"Updated last_version_no for {len(results)} unique {table_name}")
     
     
+    def compute_jar_diff_stats(self, service_name=None):
+        """Precompute insertions/deletions of modified source files between consecutive JAR versions
+
+        The counts are stored in version_diff_stats, so the JAR diff summary reads them
+        instead of diffing the sources on the request path. Pairs already stored are skipped.
+        """
+        logger.info("Computing source diff statistics between consecutive JAR versions...")
+        
+        db = self.get_db_session()
+        
+        try:
+            query = db.query(JarFile.jar_name, JarFile.version_no).filter(
+                JarFile.is_third_party == False,
+                JarFile.version_no.isnot(None)
+            )
+            if service_name:
+                service = db.query(Service).filter(Service.service_name == service_name).first()
+                if not service:
+                    logger.error(f"Service {service_name} not found")
+                    return False
+                jar_names = db.query(JarFile.jar_name).filter(JarFile.service_id == service.id)
+                query = query.filter(JarFile.jar_name.in_(jar_names))
+            
+            jar_versions = defaultdict(set)
+            for jar_name, version_no in query.distinct().all():
+                jar_versions[jar_name].add(version_no)
+            
+            total_saved = 0
+            for jar_name, versions in jar_versions.items():
+                versions = sorted(versions)
+                saved = 0
+                for from_version, to_version in zip(versions, versions[1:]):
+                    saved += self._save_jar_diff_stats(db, jar_name, from_version, to_version)
+                db.commit()
+                total_saved += saved
+                if saved:
+                    logger.info(f"JAR {jar_name}: {saved} version pair diff stats saved")
+            
+            logger.info(f"Diff statistics computation completed: {total_saved} version pairs saved")
+            return True
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error during diff statistics computation: {e}")
+            raise
+        finally:
+            db.close()
+    
+    def _save_jar_diff_stats(self, db, jar_name, from_version, to_version):
+        """Diff the modified source files of two JAR versions and add their line counts, returns the number of pairs added"""
+        from_files = {class_name_from_source_path(f.file_path): f for f in load_jar_source_rows(db, jar_name, from_version)}
+        to_files = {class_name_from_source_path(f.file_path): f for f in load_jar_source_rows(db, jar_name, to_version)}
+        
+        changed_pairs = [
+            (from_files[name], to_files[name]) for name in from_files.keys() & to_files.keys()
+            if not same_source_content(from_files[name], to_files[name])
+        ]
+        stored = load_version_diff_stats(db, changed_pairs)
+        pending = {
+            (from_file.id, to_file.id): (from_file, to_file) for from_file, to_file in changed_pairs
+            if (from_file.id, to_file.id) not in stored
+        }
+        if not pending:
+            return 0
+        
+        load_source_contents(db, [source for pair in pending.values() for source in pair])
+        stats = []
+        for (from_id, to_id), (from_file, to_file) in pending.items():
+            # Identical content is reported as unchanged without stats
+            if from_file.file_content == to_file.file_content:
+                continue
+            insertions, deletions, _ = diff_source_texts(from_file.file_content, to_file.file_content)
+            stats.append(VersionDiffStat(from_version_id=from_id, to_version_id=to_id,
+                                         insertions=insertions, deletions=deletions))
+        db.add_all(stats)
+        # Flush so later version pairs of this JAR see the rows (a pair can recur when a file reverts)
+        db.flush()
+        return len(stats)
+    
     def get_version_statistics(self, service_name=None):
         """Get version statistics"""
         logger.info("Getting version statistics...")
@@ -448,6 +530,8 @@ def main():
     parser.add_argument('--generate-class-versions', action='store_true', help='Generate Class versions and merge source mappings')
     parser.add_argument('--compares-by', choices=['file-size', 'source-hash'], default='file-size',
                        help='Comparison method for version generation (default: file-size)')
+    parser.add_argument('--compute-diff-stats', action='store_true',
+                       help='Precompute source diff line counts between consecutive JAR versions')
     parser.add_argument('--stats-only', action='store_true', help='Show statistics only')
     
     args = parser.parse_args()
@@ -467,8 +551,11 @@ def main():
             if args.generate_class_versions:
                 manager.generate_class_versions(args.service_name)
             
-            if not any([args.generate_jar_versions, args.generate_class_versions]):
-                logger.info("No action specified. Use --generate-jar-versions or --generate-class-versions")
+            if args.compute_diff_stats:
+                manager.compute_jar_diff_stats(args.service_name)
+            
+            if not any([args.generate_jar_versions, args.generate_class_versions, args.compute_diff_stats]):
+                logger.info("No action specified. Use --generate-jar-versions, --generate-class-versions or --compute-diff-stats")
         
         logger.info("Operation completed successfully!")
         
@@ -0,0 +1,15 @@
+-- Add FULLTEXT indexes for JAR/class name search (used when SEARCH_USE_FULLTEXT=true)
+-- MySQL 8.0+
+
+USE jal;
+
+-- Word-prefix search on JAR names
+ALTER TABLE jar_files 
+ADD FULLTEXT INDEX ft_jar_name (jar_name);
+
+-- Word-prefix search on class full names
+ALTER TABLE class_files 
+ADD FULLTEXT INDEX ft_class_full_name (class_full_name);
+
+-- Note: JAR source search (java_source_files.class_full_name) uses the existing
+-- idx_java_source_class_name_fulltext index from schema_v2.sql
@@ -0,0 +1,14 @@
+-- Add composite indexes for per-service statistics and listings
+-- (get_services grouped counts / latest last_modified, service JAR and class lists)
+-- MySQL 8.0+
+
+USE jal;
+
+-- service_id IN (...) AND is_third_party = ? GROUP BY service_id: COUNT(*), MAX(last_modified)
+CREATE INDEX idx_jar_files_service_stats ON jar_files(service_id, is_third_party, last_modified);
+
+-- service_id IN (...) GROUP BY service_id: COUNT(*), MAX(last_modified)
+CREATE INDEX idx_class_files_service_stats ON class_files(service_id, last_modified);
+
+-- Note: jar_files(jar_name, version_no, is_third_party) and class_files(class_full_name, version_no)
+-- are already covered by idx_jar_files_lookup / idx_class_files_lookup (add_version_lookup_indexes.sql)
@@ -0,0 +1,17 @@
+-- Add version_diff_stats table for precomputed source diff line counts
+-- MySQL 8.0+
+
+USE jal;
+
+-- Version diff statistics table - 源码版本对行数差异统计表
+CREATE TABLE IF NOT EXISTS version_diff_stats (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    from_version_id INT NOT NULL COMMENT '源版本（java_source_file_versions.id）',
+    to_version_id INT NOT NULL COMMENT '目标版本（java_source_file_versions.id）',
+    insertions INT NOT NULL DEFAULT 0 COMMENT '新增行数',
+    deletions INT NOT NULL DEFAULT 0 COMMENT '删除行数',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (from_version_id) REFERENCES java_source_file_versions(id) ON DELETE CASCADE,
+    FOREIGN KEY (to_version_id) REFERENCES java_source_file_versions(id) ON DELETE CASCADE,
+    UNIQUE KEY uk_version_pair (from_version_id, to_version_id)
+);
@@ -0,0 +1,14 @@
+-- Add composite indexes for JAR/class version lookups and diff queries
+-- (get_jar_versions / get_class_versions / get_jar_diff / get_class_diff)
+-- MySQL 8.0+
+
+USE jal;
+
+-- jar_name = ? AND version_no = ? AND is_third_party = ?
+CREATE INDEX idx_jar_files_lookup ON jar_files(jar_name, version_no, is_third_party);
+
+-- class_full_name = ? AND version_no = ?
+CREATE INDEX idx_class_files_lookup ON class_files(class_full_name, version_no);
+
+-- Note: java_source_in_jar_files(jar_file_id) and (java_source_file_version_id)
+-- are already covered by idx_jar_source_jar / idx_jar_source_version
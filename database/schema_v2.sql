@@ -5,6 +5,7 @@
 -- Use existing database
 
 -- 删除旧表（如果存在）
+DROP TABLE IF EXISTS version_diff_stats;
 DROP TABLE IF EXISTS source_differences;
 DROP TABLE IF EXISTS java_source_files;
 DROP TABLE IF EXISTS jar_files;
@@ -55,7 +56,8 @@ CREATE TABLE jar_files (
     FOREIGN KEY (service_id) REFERENCES services(id) ON DELETE CASCADE,
     UNIQUE KEY uk_service_jar (service_id, jar_name),
     INDEX idx_jar_name (jar_name),
-    INDEX idx_version_no (version_no)
+    INDEX idx_version_no (version_no),
+    FULLTEXT INDEX ft_jar_name (jar_name)
 );
 
 -- Class files table - Class文件信息表
@@ -76,7 +78,8 @@ CREATE TABLE class_files (
     FOREIGN KEY (java_source_file_version_id) REFERENCES java_source_file_versions(id) ON DELETE SET NULL,
     UNIQUE KEY uk_service_class (service_id, class_full_name),
     INDEX idx_class_full_name (class_full_name),
-    INDEX idx_version_no (version_no)
+    INDEX idx_version_no (version_no),
+    FULLTEXT INDEX ft_class_full_name (class_full_name)
 );
 
 -- Java source files table - Java源码文件表
@@ -117,6 +120,19 @@ CREATE TABLE java_source_in_jar_files (
     UNIQUE KEY uk_jar_source_version (jar_file_id, java_source_file_version_id)
 );
 
+-- Version diff statistics table - 源码版本对行数差异统计表
+CREATE TABLE version_diff_stats (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    from_version_id INT NOT NULL COMMENT '源版本（java_source_file_versions.id）',
+    to_version_id INT NOT NULL COMMENT '目标版本（java_source_file_versions.id）',
+    insertions INT NOT NULL DEFAULT 0 COMMENT '新增行数',
+    deletions INT NOT NULL DEFAULT 0 COMMENT '删除行数',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (from_version_id) REFERENCES java_source_file_versions(id) ON DELETE CASCADE,
+    FOREIGN KEY (to_version_id) REFERENCES java_source_file_versions(id) ON DELETE CASCADE,
+    UNIQUE KEY uk_version_pair (from_version_id, to_version_id)
+);
+
 
 -- Source differences table - 源码差异表
 CREATE TABLE source_differences (
@@ -142,6 +158,10 @@ CREATE INDEX idx_jar_files_service ON jar_files(service_id);
 CREATE INDEX idx_jar_files_latest ON jar_files(is_latest);
 CREATE INDEX idx_jar_files_third_party ON jar_files(is_third_party);
 CREATE INDEX idx_class_files_service ON class_files(service_id);
+CREATE INDEX idx_jar_files_lookup ON jar_files(jar_name, version_no, is_third_party);
+CREATE INDEX idx_class_files_lookup ON class_files(class_full_name, version_no);
+CREATE INDEX idx_jar_files_service_stats ON jar_files(service_id, is_third_party, last_modified);
+CREATE INDEX idx_class_files_service_stats ON class_files(service_id, last_modified);
 -- Note: jar_files.jar_name already has INDEX idx_jar_name
 -- Note: jar_files.version_no already has INDEX idx_version_no
 -- Note: class_files.class_full_name already has INDEX idx_class_full_name
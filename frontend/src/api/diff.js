@@ -13,6 +13,9 @@ export async function getVersionDiff(type, name, fromVersion, toVersion, filePat
     
     if (filePath) {
       params.file_path = filePath
+    } else if (type === 'jar') {
+      // JAR整体差异只用到文件列表和统计，summary 格式直接读取预计算的行数差异
+      params.format = 'summary'
     }
     
     const response = await axios.get(`${API_BASE_URL}/${endpoint}/${encodeURIComponent(name)}/diff`, {
@@ -3,12 +3,14 @@ import axios from 'axios'
 const API_BASE_URL = ''
 
 // 搜索JAR和Class文件
-export async function searchItems(query, type = 'all') {
+export async function searchItems(query, type = 'all', skip = 0, limit = 100) {
   try {
     const response = await axios.get(`${API_BASE_URL}/api/search`, {
       params: {
         q: query,
-        type: type
+        type: type,
+        skip: skip,
+        limit: limit
       }
     })
     return response.data